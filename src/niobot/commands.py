@@ -1,6 +1,8 @@
 import inspect
+import itertools
 import logging
-import os
+import sys
+import types
 import typing
 import warnings
 from collections.abc import Callable
@@ -17,6 +19,9 @@ if typing.TYPE_CHECKING:
 __all__ = ("Command", "command", "event", "Module", "Argument", "check")
 
 _T = typing.TypeVar("_T")
+_command_ids = itertools.count()
+
+log = logging.getLogger(__name__)
 
 
 class Argument:
@@ -56,7 +61,6 @@ class Argument:
     ):
         if default is inspect.Parameter.default:
             default = ...
-        log = logging.getLogger(__name__)
         self.name = name
         self.type = arg_type
         self.description = description
@@ -102,6 +106,20 @@ class Argument:
                         )
                     )
 
+        # Command.invoke calls this directly on the raw value instead of going through the parser, if it is set.
+        # Only the stock parsers are equivalent to calling the type itself, so anything else (including a parser
+        # swapped into BUILTIN_MAPPING by the application) goes through the parser as normal.
+        self._fast: typing.Optional[Callable[[str], typing.Any]] = None
+        from .utils import FloatParser, IntegerParser
+
+        if self.type is str and self.parser is Argument.internal_parser:
+            self._fast = str
+        elif self.type is int and type(self.parser) is IntegerParser:
+            if self.parser.base == 10 and not self.parser.allow_floats:
+                self._fast = int
+        elif self.type is float and type(self.parser) is FloatParser:
+            self._fast = float
+
     def __repr__(self):
         return (
             "<Argument name={0.name!r} type={0.type!r} default={0.default!r} required={0.required!r} "
@@ -151,8 +169,8 @@ class Command:
         help command, and will not be able to be invoked.
     :param arguments:
         A list of [`Argument`][niobot.commands.Argument] instances. Will be used to parse the arguments given to the
-        command.
-        `ctx` is always the first argument, regardless of what you put here.
+        command. Stored as a tuple on the command.
+        `ctx` is always passed as the first argument to the callback, and should not be included here.
     :param usage:
         A string representing how to use this command's arguments. Will be shown in the auto-generated help.
         Do not include the command name or your bot's prefix here, only arguments.
@@ -178,13 +196,13 @@ class Command:
         arguments: typing.Optional[list[Argument]] = None,
         **kwargs,
     ):
-        self.__runtime_id = os.urandom(16).hex()
-        self.log = logging.getLogger(__name__)
-        self.name = name
+        self.__runtime_id = next(_command_ids)
+        self.log = log
+        self.name = sys.intern(name)
         self.callback = callback
         self.description = description
         self.disabled = disabled
-        self.aliases = aliases or []
+        self.aliases = [sys.intern(alias) for alias in aliases or []]
         self.checks = kwargs.pop("checks", [])
         if hasattr(self.callback, "__nio_checks__"):
             for check_func in self.callback.__nio_checks__.keys():
@@ -192,15 +210,11 @@ class Command:
         self.hidden = hidden
         self.usage = usage or None
         self.module = kwargs.pop("module", None)
-        self.arguments = arguments or None
-        if not self.arguments:
-            if self.arguments is False:  # do not autodetect arguments
-                self.arguments = []
-            else:
-                self.arguments = self.autodetect_args(self.callback)
-        _CTX_ARG = Argument("ctx", Context, description="The context for the command", parser=lambda ctx, *_: ctx)
-        self.arguments.insert(0, _CTX_ARG)
-        self.arguments: list[Argument]
+        if arguments is False:  # do not autodetect arguments
+            arguments = ()
+        elif not arguments:
+            arguments = self.autodetect_args(self.callback)
+        self.arguments: tuple[Argument, ...] = tuple(arguments)
         self.greedy = greedy
 
     @staticmethod
@@ -215,7 +229,6 @@ class Command:
         # If it has a default value, assign that default value to the Argument.
         # If the parameter is `self`, ignore it.
         # If the parameter is `ctx`, use the `Context` type.
-        log = logging.getLogger(__name__)
         args = []
         for n, parameter in enumerate(inspect.signature(callback).parameters.values()):
             # If it has a parent class and this is the first parameter, skip it.
@@ -262,7 +275,7 @@ class Command:
         return args
 
     def __hash__(self):
-        return hash(self.__runtime_id)
+        return self.__runtime_id
 
     def __eq__(self, other):
         """Checks if another command's runtime ID is the same as this one's"""
@@ -285,7 +298,7 @@ class Command:
         usage = []
         req = "<{!s}>"
         opt = "[{!s}]"
-        for arg in self.arguments[1:]:
+        for arg in self.arguments:
             if arg.required:
                 usage.append(req.format(arg.name))
             else:
@@ -314,36 +327,46 @@ class Command:
                 if not cr:
                     raise CheckFailure(name)
 
-        parsed_args = []
-        if len(ctx.args) > (len(self.arguments) - 1) and self.greedy is False:
+        arguments = self.arguments
+        # Index the view directly so that, for quoted input, only the arguments this command takes are sliced out
+        args = ctx.argument_view
+        given = len(args)
+        if given > len(arguments) and self.greedy is False:
             raise CommandArgumentsError(f"Too many arguments given to command {self.name}")
-        for index, argument in enumerate(self.arguments[1:]):
-            argument: Argument
-
-            if index >= len(ctx.args):
-                if argument.required:
-                    raise CommandArgumentsError(f"Missing required argument {argument.name}")
-                parsed_args.append(argument.default)
-                continue
 
-            self.log.debug("Resolved argument %s to %r", argument.name, ctx.args[index])
+        parsed_args = [None] * (len(arguments) + 1)
+        parsed_args[0] = ctx
+        for index in range(min(given, len(arguments))):
+            argument = arguments[index]
+            value = args[index]
+            self.log.debug("Resolved argument %s to %r", argument.name, value)
+            fast = argument._fast
+            if fast is int and not value.isdecimal():
+                # Signs, whitespace and invalid input are left to the real parser, so that malformed input does not
+                # fail int() twice before the parser raises its error.
+                fast = None
+            if fast is not None:
+                try:
+                    parsed_args[index + 1] = fast(value)
+                    continue
+                except ValueError:
+                    pass  # let the parser raise its usual error
             try:
-                parsed_argument = argument.parser(ctx, argument, ctx.args[index])
+                parsed_argument = argument.parser(ctx, argument, value)
                 if inspect.iscoroutine(parsed_argument):
                     parsed_argument = await parsed_argument
             except Exception as e:
                 error = f"Error while parsing argument {argument.name}: {e}"
                 raise CommandArgumentsError(error) from e
-            parsed_args.append(parsed_argument)
-
-        parsed_args = [ctx, *parsed_args]
-        if len(parsed_args) != len(self.arguments):
-            self.log.warning(
-                "Parsed arguments length does not match registered arguments length. %d processed arguments, %d "
-                "arguments.",
-                len(parsed_args),
-                len(self.arguments),
-            )
+            parsed_args[index + 1] = parsed_argument
+
+        # Anything not given falls back to its default
+        for index in range(given, len(arguments)):
+            argument = arguments[index]
+            if argument.required:
+                raise CommandArgumentsError(f"Missing required argument {argument.name}")
+            parsed_args[index + 1] = argument.default
+
         self.log.debug("Arguments to pass: %r", parsed_args)
         if self.module:
             self.log.debug("Will pass module instance")
@@ -471,33 +494,44 @@ class Module:
     def client(self, value: "NioBot"):
         self.bot = value
 
+    @classmethod
+    def _marked_names(cls, marker: str) -> list[str]:
+        # Looked up on each call (this is only used around mounting and unmounting), so commands attached to the class
+        # at any point are found. Only the class is inspected, so instance properties are not evaluated.
+        return [name for name in dir(cls) if hasattr(getattr(cls, name, None), marker)]
+
+    def _list_marked(self, marker: str) -> typing.Generator[typing.Any, None, None]:
+        names = self._marked_names(marker)
+        instance_names = [name for name, value in vars(self).items() if hasattr(value, marker)]
+        if instance_names:
+            names = sorted({*names, *instance_names})
+        for name in names:
+            value = getattr(getattr(self, name, None), marker, None)
+            if value is not None:
+                yield value
+
     def list_commands(self) -> typing.Generator[Command, None, None]:
-        for _, potential_command in inspect.getmembers(self):
-            if hasattr(potential_command, "__nio_command__"):
-                yield potential_command.__nio_command__
+        return self._list_marked("__nio_command__")
 
-    def list_events(self):
-        for _, potential_event in inspect.getmembers(self):
-            if hasattr(potential_event, "__nio_event__"):
-                yield potential_event.__nio_event__
+    def list_events(self) -> typing.Generator[dict, None, None]:
+        return self._list_marked("__nio_event__")
 
     def _event_handler_callback(self, function):
-        # Due to the fact events are less stateful than commands, we need to manually inject self for events
-        async def wrapper(*args, **kwargs):
-            return await function(self, *args, **kwargs)
-
-        return wrapper
+        # Due to the fact events are less stateful than commands, we need to manually inject self for events.
+        # A bound method does that without wrapping every dispatch in another coroutine, and keeps the __qualname__
+        # that NioBot.dispatch names its tasks after.
+        return types.MethodType(function, self)
 
     def __setup__(self):
         """Setup function called once by NioBot.mount_module(). Mounts every command discovered."""
         for cmd in self.list_commands():
             cmd.module = self
-            logging.getLogger(__name__).debug("Discovered command %r in %s.", cmd, self.__class__.__name__)
+            log.debug("Discovered command %r in %s.", cmd, self.__class__.__name__)
             self.bot.add_command(cmd)
 
         for _event in self.list_events():
             _event["_module_instance"] = self
-            self.bot.add_event_listener(_event["name"], self._event_handler_callback(_event["function"]))
+            self.bot.add_event_listener(sys.intern(_event["name"]), self._event_handler_callback(_event["function"]))
 
     def __teardown__(self):
         """Teardown function called once by NioBot.unmount_module(). Removes any command that was mounted."""
@@ -22,9 +22,12 @@ class ContextualResponse:
 
     Usage of this function is not required, however it is a useful utility."""
 
+    __slots__ = ("ctx", "_response", "_message")
+
     def __init__(self, ctx: "Context", response: nio.RoomSendResponse):
         self.ctx = ctx
         self._response = response
+        self._message: typing.Optional[nio.RoomMessageText] = None
 
     def __repr__(self):
         return "<ContextualResponse ctx={0.ctx!r} response={0.response!r}>".format(self)
@@ -32,9 +35,12 @@ class ContextualResponse:
     @property
     def message(self) -> typing.Optional[nio.RoomMessageText]:
         """Fetches the current message for this response"""
+        if self._message is not None:
+            return self._message
         result = self.ctx.client.get_cached_message(self._response.event_id)
         if result:
-            return result[1]
+            self._message = result[1]
+            return self._message
         else:
             logger.warning("Original response for context %r was not found in cache, unable to modify.", self.ctx)
 
@@ -48,9 +54,8 @@ class ContextualResponse:
         :return: a new ContextualResponse object.
         """
 
-        return ContextualResponse(
-            self.ctx, await self.ctx.client.send_message(self.ctx.room, *args, reply_to=self._response.event_id)
-        )
+        ctx = self.ctx
+        return ContextualResponse(ctx, await ctx.client.send_message(ctx.room, *args, reply_to=self._response.event_id))
 
     async def edit(self, content: str, **kwargs) -> "ContextualResponse":
         """
@@ -60,7 +65,9 @@ class ContextualResponse:
         :param kwargs: Any extra arguments to pass to Client.edit_message
         :return: self
         """
-        await self.ctx.client.edit_message(self.ctx.room, self._response.event_id, content, **kwargs)
+        ctx = self.ctx
+        await ctx.client.edit_message(ctx.room, self._response.event_id, content, **kwargs)
+        self._message = None
         return self
 
     async def delete(self, reason: typing.Optional[str] = None) -> None:
@@ -70,12 +77,30 @@ class ContextualResponse:
         :param reason: An optional reason for the redaction
         :return: None, as there will be no more response.
         """
-        await self.ctx.client.delete_message(self.ctx.room, self._response.event_id, reason=reason)
+        ctx = self.ctx
+        await ctx.client.delete_message(ctx.room, self._response.event_id, reason=reason)
 
 
 class Context:
     """Event-based context for a command callback"""
 
+    __slots__ = (
+        "_init_ts",
+        "_client",
+        "_room",
+        "_event",
+        "_command",
+        "invoking_prefix",
+        "_invoking_string",
+        "_args_offset",
+        "_args",
+        "_original_response",
+        "_latency",
+        # set by NioBot.process_message
+        "_task",
+        "_perf_timer",
+    )
+
     def __init__(
         self,
         _client: "NioBot",
@@ -93,21 +118,11 @@ class Context:
         self._command = command
         self.invoking_prefix = invoking_prefix
         self._invoking_string = invoking_string
-        to_parse = event.body
-
-        if invoking_string:
-            try:
-                to_parse = event.body[len(invoking_string) :]
-            except IndexError:
-                to_parse = ""
-        self._args = ArgumentView(to_parse)
-        self._args.parse_arguments()
+        # Arguments are only parsed once something asks for them, directly from the message body
+        self._args_offset = len(invoking_string) if invoking_string else 0
+        self._args: typing.Optional[ArgumentView] = None
         self._original_response = None
-
-        # property aliases
-        self.bot = self.client
-        self.msg = self.event = self.message
-        self.arguments = self.args
+        self._latency: typing.Optional[float] = None
 
     def __repr__(self):
         return "<Context room={0.room!r} event={0.event!r} command={0.command!r}>".format(self)
@@ -127,21 +142,38 @@ class Context:
         """The current instance of the client"""
         return self._client
 
+    bot = client
+
     @property
     def command(self) -> "Command":
         """The current command being invoked"""
         return self._command
 
+    @property
+    def argument_view(self) -> ArgumentView:
+        """The parsed view of the arguments given to this command. Parsed on first access."""
+        if self._args is None:
+            body = self._event.body
+            self._args = ArgumentView(body, start=self._args_offset)
+            # Argument-less invocations (e.g. `!ping`) have nothing after the invoking string to parse
+            if self._args_offset < len(body):
+                self._args.parse_arguments()
+        return self._args
+
     @property
     def args(self) -> list[str]:
         """Each argument given to this command"""
-        return self._args.arguments
+        return self.argument_view.arguments
+
+    arguments = args
 
     @property
     def message(self) -> nio.RoomMessageText:
         """The current message"""
         return self._event
 
+    msg = event = message
+
     @property
     def original_response(self) -> typing.Optional[nio.RoomSendResponse]:
         """The result of Context.reply(), if it exists."""
@@ -150,7 +182,9 @@ class Context:
     @property
     def latency(self) -> float:
         """Returns the current event's latency in milliseconds."""
-        return self.client.latency(self.event, received_at=self._init_ts)
+        if self._latency is None:
+            self._latency = self.client.latency(self.event, received_at=self._init_ts)
+        return self._latency
 
     async def respond(
         self, content: typing.Optional[str] = None, file: typing.Optional["BaseAttachment"] = None
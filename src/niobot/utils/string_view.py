@@ -1,4 +1,6 @@
 import logging
+import re
+import typing
 
 # Inspiration from https://github.com/Pycord-Development/pycord/blob/36fea3/discord/ext/commands/view.py#L55
 
@@ -8,6 +10,22 @@ QUOTES = ['"', "'", "`"]
 
 log = logging.getLogger(__name__)
 
+_QUOTE_CHARS = re.escape("".join(QUOTES))
+# Each match is one argument: optional unquoted text, optionally followed by a quoted section that ends the argument.
+# A quote preceded by a backslash is taken literally, and an unterminated quote runs to the end of the string.
+_ARGUMENT_RE = re.compile(
+    rf"""
+    (?=\S)
+    (?P<word>(?:[^\s{_QUOTE_CHARS}]|(?<=\\)[{_QUOTE_CHARS}])*)
+    (?:
+        (?P<quote>[{_QUOTE_CHARS}])
+        (?P<quoted>(?:(?!(?P=quote)).|(?<=\\)(?P=quote))*)
+        (?:(?P=quote)|\Z)
+    )?
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
 
 class ArgumentView:
     """A parser designed to allow for multi-word arguments and quotes
@@ -17,14 +35,51 @@ class ArgumentView:
 
     This is most useful when parsing arguments from a command, as it allows for multi-word arguments.
 
+    Input without any quotes is simply split on whitespace. For quoted input, parsing only records where each
+    argument sits in the source string, and the arguments themselves are sliced out of the source when they are first
+    accessed, either by indexing the view (`view[0]`) or through
+    [`arguments`][niobot.utils.string_view.ArgumentView.arguments].
+
     :param string: The string to parse
+    :param start: The index in `string` to start parsing from. Everything before it is ignored, so this parses the
+        same arguments as `string[start:]` would.
     """
 
-    def __init__(self, string: str):
+    def __init__(self, string: str, start: int = 0):
         self.source = string
-        self.index = 0
+        self.index = start
+
+        # (start, end, quote) offsets into the source for each argument.
+        # `quote` is the index of an opening quote inside the argument that must be skipped, or -1 if the argument is
+        # a plain slice of the source.
+        self._spans: list[tuple[int, int, int]] = []
+        # Once materialised (or modified through add_arg), this list is what len() and indexing read from.
+        self._arguments: typing.Optional[list[str]] = None
+
+    def __len__(self) -> int:
+        if self._arguments is not None:
+            return len(self._arguments)
+        return len(self._spans)
+
+    def __getitem__(self, index: int) -> str:
+        if self._arguments is not None:
+            return self._arguments[index]
+        return self._slice(self._spans[index])
+
+    def _slice(self, span: tuple[int, int, int]) -> str:
+        start, end, quote = span
+        if quote == -1:
+            return self.source[start:end]
+        return self.source[start:quote] + self.source[quote + 1 : end]
+
+    @property
+    def arguments(self) -> list[str]:
+        """Every parsed argument, as a list of strings.
 
-        self.arguments: list[str] = []
+        :return: The parsed arguments"""
+        if self._arguments is None:
+            self._arguments = [self._slice(span) for span in self._spans] if self._spans else []
+        return self._arguments
 
     def add_arg(self, argument: str) -> None:
         """Adds an argument to the argument list
@@ -35,6 +90,11 @@ class ArgumentView:
             return
         self.arguments.append(argument)
 
+    def _add_span(self, start: int, end: int, quote: int = -1) -> None:
+        if end - start - (quote != -1) <= 0:
+            return
+        self._spans.append((start, end, quote))
+
     @property
     def eof(self) -> bool:
         """Returns whether the parser has reached the end of the string
@@ -48,42 +108,46 @@ class ArgumentView:
         """Main parsing engine.
 
         :returns: self"""
-        reconstructed = ""
-        quote_started = False
-        quote_char = None
-        while not self.eof:
-            char = self.source[self.index]
-            if char in QUOTES:
-                # if we're already quoted, we need to check if the last character was an escape (\\)
-                # If it is escaped, add it to the string.
-                # If it isn't, we can end the quote.
-                if quote_started:
-                    if self.index > 0 and (self.source[self.index - 1] == "\\" or quote_char != char):
-                        reconstructed += char
-                    else:
-                        quote_started = False
-                        self.add_arg(reconstructed)
-                        reconstructed = ""
-                        quote_char = None
-                elif self.index == 0:  # cannot be an escaped string
-                    quote_started = True
-                    quote_char = char
-                elif self.index > 0 and self.source[self.index - 1] != "\\":
-                    quote_started = True
-                    quote_char = char
-                else:
-                    reconstructed += char
-            elif char.isspace():
-                if quote_started:
-                    reconstructed += char
-                else:
-                    self.add_arg(reconstructed)
-                    reconstructed = ""
-                    quote_char = None
-            elif char:  # elif ensures the character isn't null
-                reconstructed += char
-            self.index += 1
-        # If we have a reconstructed string, we can add it to the arguments list
-        if reconstructed:
-            self.add_arg(reconstructed)
+        source = self.source
+        if self.index >= len(source):
+            return self
+        for quote in QUOTES:
+            if quote in source:
+                break
+        else:
+            # Without quotes this is a plain whitespace split, which is cheaper than the regex for short input.
+            if self._arguments is None and not self._spans:
+                self._arguments = source[self.index :].split()
+            else:
+                # Keep anything parsed or added before
+                self.arguments.extend(source[self.index :].split())
+            self.index = len(source)
+            return self
+        position = self.index
+        offset = 0
+        if position and source[position - 1] == "\\":
+            # The escape lookbehinds would see the backslash before the starting index, so parse the rest on its own
+            # and shift the offsets back afterwards.
+            source, offset, position = source[position:], position, 0
+        first = len(self._spans)
+        for match in _ARGUMENT_RE.finditer(source, position):
+            start, end = match.span("word")
+            if match.group("quote") is None:
+                self._add_span(start, end)
+                continue
+            quote = match.start("quote")
+            if start == end:
+                # nothing came before the quote, so the argument is a plain slice
+                self._add_span(quote + 1, match.end("quoted"))
+            else:
+                self._add_span(start, match.end("quoted"), quote)
+        if offset:
+            self._spans[first:] = [
+                (start + offset, end + offset, quote + offset if quote != -1 else -1)
+                for start, end, quote in self._spans[first:]
+            ]
+        if self._arguments is not None:
+            # The list has already been materialised (or added to), so it has to be kept up to date
+            self._arguments.extend(self._slice(span) for span in self._spans[first:])
+        self.index = len(self.source)
         return self
@@ -0,0 +1,149 @@
+import nio
+import niobot
+import pytest
+from niobot.utils import BUILTIN_MAPPING, IntegerParser
+
+
+def make_context(command: niobot.Command, body: str) -> niobot.Context:
+    event = nio.RoomMessageText.from_dict(
+        {
+            "event_id": "$event",
+            "sender": "@user:example.com",
+            "origin_server_ts": 0,
+            "type": "m.room.message",
+            "content": {"msgtype": "m.text", "body": body},
+        }
+    )
+    return command.construct_context(None, None, event, "!", "!" + command.name)
+
+
+async def run(command: niobot.Command, body: str):
+    return await (await command.invoke(make_context(command, body)))
+
+
+def test_module_discovery():
+    async def late(self, ctx):
+        pass
+
+    async def inst(ctx):
+        pass
+
+    class Mod(niobot.Module):
+        @niobot.command()
+        async def a(self, ctx):
+            pass
+
+        @staticmethod
+        @niobot.command()
+        async def s(ctx):
+            pass
+
+        @niobot.event("ready")
+        async def on_ready(self):
+            pass
+
+        def helper(self):
+            pass
+
+    module = Mod(None)
+    assert [cmd.name for cmd in module.list_commands()] == ["a", "s"]
+    Mod.late = niobot.command()(late)
+    module.inst = niobot.command()(inst)
+    assert [cmd.name for cmd in module.list_commands()] == ["a", "inst", "late", "s"]
+    assert [evt["name"] for evt in module.list_events()] == ["ready"]
+
+    class SubMod(Mod):
+        @niobot.command()
+        async def b(self, ctx):
+            pass
+
+    assert [cmd.name for cmd in SubMod(None).list_commands()] == ["a", "b", "late", "s"]
+
+
+@pytest.mark.asyncio
+async def test_builtin_mapping_override(monkeypatch):
+    monkeypatch.setitem(BUILTIN_MAPPING, int, IntegerParser(base=16))
+
+    async def hex_command(ctx, number: int):
+        return number
+
+    command = niobot.Command("hex", hex_command)
+    assert await run(command, "!hex 10") == 16
+
+
+def test_context_without_arguments():
+    command = niobot.Command("ping", lambda ctx: None)
+    ctx = make_context(command, "!ping")
+    assert ctx.argument_view.eof
+    assert len(ctx.argument_view) == 0
+    assert ctx.args == []
+
+
+async def sample_command(ctx, number: int, word: str = "default", ratio: float = 1.5):
+    return ctx, number, word, ratio
+
+
+@pytest.mark.asyncio
+async def test_invoke_passes_context_first():
+    command = niobot.Command("sample", sample_command)
+    result = await run(command, "!sample 1 two 2.5")
+    assert isinstance(result[0], niobot.Context)
+    assert result[1:] == (1, "two", 2.5)
+
+
+@pytest.mark.asyncio
+async def test_invoke_fills_defaults():
+    command = niobot.Command("sample", sample_command)
+    assert (await run(command, "!sample 1"))[1:] == (1, "default", 1.5)
+    assert (await run(command, '!sample 1 "two words"'))[1:] == (1, "two words", 1.5)
+
+
+@pytest.mark.asyncio
+async def test_invoke_missing_required_argument():
+    command = niobot.Command("sample", sample_command)
+    with pytest.raises(niobot.CommandArgumentsError, match="Missing required argument number"):
+        await run(command, "!sample")
+
+
+@pytest.mark.asyncio
+async def test_invoke_too_many_arguments():
+    command = niobot.Command("sample", sample_command)
+    with pytest.raises(niobot.CommandArgumentsError, match="Too many arguments"):
+        await run(command, "!sample 1 two 2.5 extra")
+
+    greedy = niobot.Command("sample", sample_command, greedy=True)
+    assert (await run(greedy, "!sample 1 two 2.5 extra"))[1:] == (1, "two", 2.5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        ("!sample x", "Error while parsing argument number: Invalid integer value: x. Should be a number."),
+        ("!sample ²", "Error while parsing argument number: Invalid integer value: ². Should be a number."),
+        ("!sample 1 two y", "Error while parsing argument ratio: Invalid float value: y. Should be a number."),
+    ],
+)
+async def test_invoke_invalid_numbers(body: str, message: str):
+    command = niobot.Command("sample", sample_command)
+    with pytest.raises(niobot.CommandArgumentsError) as error:
+        await run(command, body)
+    assert str(error.value) == message
+    assert isinstance(error.value.__cause__, niobot.CommandParserError)
+
+
+@pytest.mark.asyncio
+async def test_invoke_number_formats():
+    command = niobot.Command("sample", sample_command)
+    assert (await run(command, "!sample -5 two 1e3"))[1:] == (-5, "two", 1000.0)
+    assert (await run(command, "!sample 1_000"))[1] == 1000
+
+
+def test_arguments_false_disables_detection():
+    assert niobot.Command("sample", sample_command, arguments=False).arguments == ()
+    assert [arg.name for arg in niobot.Command("sample", sample_command).arguments] == ["number", "word", "ratio"]
+
+
+def test_display_usage():
+    assert niobot.Command("sample", sample_command).display_usage == "<number> [word] [ratio]"
+    assert niobot.Command("ping", lambda ctx: None).display_usage == ""
@@ -0,0 +1,79 @@
+import pytest
+from niobot.utils.string_view import ArgumentView
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("", []),
+        ("   ", []),
+        ("1 2 3", ["1", "2", "3"]),
+        ("  1   2\n3\t", ["1", "2", "3"]),
+        ('1 "2 3" 4', ["1", "2 3", "4"]),
+        ("'single quoted' `back ticked`", ["single quoted", "back ticked"]),
+        ('"it\'s mixed"', ["it's mixed"]),
+        ('"" empty', ["empty"]),
+        ('"unterminated quote', ["unterminated quote"]),
+        ('prefix"quoted part" after', ["prefixquoted part", "after"]),
+        ('"a""b"c', ["a", "b", "c"]),
+        (r"escaped\"quote", ['escaped\\"quote']),
+        (r'"escaped \" inside"', ['escaped \\" inside']),
+        ("trailing\\", ["trailing\\"]),
+    ],
+)
+def test_argument_view(source: str, expected: list[str]):
+    view = ArgumentView(source).parse_arguments()
+    assert view.arguments == expected
+    assert len(view) == len(expected)
+    assert [view[n] for n in range(len(view))] == expected
+
+
+def test_argument_view_start():
+    view = ArgumentView('!command 1 "2 3"', start=len("!command")).parse_arguments()
+    assert view.arguments == ["1", "2 3"]
+    assert ArgumentView("!command", start=len("!command")).parse_arguments().arguments == []
+
+
+@pytest.mark.parametrize(
+    "source, start",
+    [
+        ("\\`", 1),
+        ('!cmd\\"a b" c', 5),
+        ("!cmd\\ 'x y'", 4),
+    ],
+)
+def test_argument_view_start_matches_slice(source: str, start: int):
+    view = ArgumentView(source, start=start).parse_arguments()
+    expected = ArgumentView(source[start:]).parse_arguments().arguments
+    assert view.arguments == expected
+    assert [view[n] for n in range(len(view))] == expected
+
+
+def test_argument_view_arguments_before_parse():
+    view = ArgumentView("1 2")
+    assert view.arguments == []
+    assert view.parse_arguments().arguments == ["1", "2"]
+
+
+def test_argument_view_add_arg():
+    view = ArgumentView("1 2").parse_arguments()
+    view.add_arg("3")
+    view.add_arg("")
+    assert view.arguments == ["1", "2", "3"]
+    assert len(view) == 3
+    assert view[2] == "3"
+
+
+@pytest.mark.parametrize("source", ["1 2", '1 "2 3"', ""])
+def test_argument_view_parse_twice(source: str):
+    expected = ArgumentView(source).parse_arguments().arguments
+    assert ArgumentView(source).parse_arguments().parse_arguments().arguments == expected
+
+
+@pytest.mark.parametrize("source, expected", [("1 2", ["x", "1", "2"]), ('1 "2 3"', ["x", "1", "2 3"])])
+def test_argument_view_add_arg_before_parse(source: str, expected: list[str]):
+    view = ArgumentView(source)
+    view.add_arg("x")
+    view.parse_arguments()
+    assert view.arguments == expected
+    assert [view[n] for n in range(len(view))] == expected